@@ -13,9 +13,11 @@
         let
           pythonDev = pkgs.python3.withPackages (ps: [
             ## Production Dependencies:
+            ps.orjson
             ps.pydantic
             ps.python-dateutil
-            ps.python-frontmatter
+            ps.pyyaml
+            ps.requests
 
             ## Testing tools:
             ps.mypy
@@ -37,9 +39,11 @@
             {
               doCheck = false;
               libraries = [
+                pkgs.python3Packages.orjson
                 pkgs.python3Packages.pydantic
                 pkgs.python3Packages.python-dateutil
-                pkgs.python3Packages.python-frontmatter
+                pkgs.python3Packages.pyyaml
+                pkgs.python3Packages.requests
               ];
             }
             (builtins.readFile ./gh-cpi.py);
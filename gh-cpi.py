@@ -1,66 +1,37 @@
+from __future__ import annotations
+
 import argparse
+import concurrent.futures
 import datetime
-import json
+import operator
 import os
-import subprocess
+import re
+import string
 import sys
-from enum import Enum
-from typing import Any, Literal
-
-import frontmatter
-from pydantic import BaseModel, Field, ValidationError
-
-
-class StatusEnum(str, Enum):
-    inbox = "Inbox"
-    triage = "Triage"
-    backlog = "Backlog"
-    planned = "Planned"
-    active = "Active"
-    done = "Done"
-
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
-class IterationEnum(str, Enum):
-    current = "@current"
-    next = "@next"
+import orjson
+import pydantic
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError
 
+if TYPE_CHECKING:
+    import requests
 
-class FootprintEnum(str, Enum):
-    small = "small"
-    medium = "medium"
-    large = "large"
 
+StatusT = Literal["Inbox", "Triage", "Backlog", "Planned", "Active", "Done"]
 
-class ComplexityEnum(str, Enum):
-    low = "low"
-    medium = "medium"
-    high = "high"
+IterationT = Literal["@current", "@next"]
 
+FootprintT = Literal["small", "medium", "large"]
 
-class IssueTypeEnum(str, Enum):
-    task = "Task"
-    bug = "Bug"
-    feature = "Feature"
-    epic = "Epic"
-    docs = "Docs"
+ComplexityT = Literal["low", "medium", "high"]
 
+IssueTypeT = Literal["Task", "Bug", "Feature", "Epic", "Docs"]
 
-class Owner(BaseModel):
-    id: str
-    login: str
-    type: Literal["User", "Organization"]
-
-    @classmethod
-    def find(cls, token: str, owner: str) -> "Owner | None":
-        query = """query($login: String!) {
-            owner: repositoryOwner(login: $login) {
-                id
-                login
-                type: __typename
-            }
-        }"""
-
-        return cls(**gh_gql(token, query, {"login": owner})["data"]["owner"])
+#: Matches a front matter delimiter line, tolerating trailing whitespace, CRLF
+#: line endings and a closing delimiter at end-of-file:
+_FRONTMATTER_DELIMITER = re.compile(rb"^---[ \t]*\r?$", re.MULTILINE)
 
 
 class Issue(BaseModel):
@@ -69,40 +40,54 @@ class Issue(BaseModel):
     repository, add it to a GitHub project, and set the project fields.
     """
 
-    owner: "Owner"
+    owner: str
     repository: str
     project: int
     title: str
     body: str
     assignees: list[str] = Field(default_factory=list)
     labels: list[str] = Field(default_factory=list)
-    type: IssueTypeEnum | None = Field(default=None)
-    status: StatusEnum = Field(default=StatusEnum.planned)
-    iteration: IterationEnum = Field(default=IterationEnum.current)
-    footprint: FootprintEnum = Field(default=FootprintEnum.medium)
-    complexity: ComplexityEnum = Field(default=ComplexityEnum.medium)
+    type: IssueTypeT | None = Field(default=None)
+    status: StatusT = Field(default="Planned")
+    iteration: IterationT = Field(default="@current")
+    footprint: FootprintT = Field(default="medium")
+    complexity: ComplexityT = Field(default="medium")
     inception: datetime.date = Field(default=datetime.date(2022, 6, 6))
 
+    #: Current iteration number, pre-computed once at construction so that the
+    #: iteration accessors below are plain attribute reads:
+    _iteration_current: int = PrivateAttr()
+
+    def model_post_init(self, context: Any, /) -> None:
+        self._iteration_current = (datetime.date.today() - self.inception).days // 7
+
     @property
     def title_rendered(self) -> str:
+        ## Short-circuit if there are no placeholders to substitute:
+        if "{" not in self.title:
+            return self.title
+
+        ## Define the available substitutions lazily so that only the ones the
+        ## title actually refers to are computed:
         now = datetime.datetime.now(datetime.UTC)
-        today = now.date()
-        tomorrow = today + datetime.timedelta(days=1)
-        this_week = now.strftime("%Y/w%U")
-        next_week = (now + datetime.timedelta(days=7)).strftime("%Y/w%U")
-        this_month = now.strftime("%Y-%m")
-        next_month = (now + datetime.timedelta(days=30)).strftime("%Y-%m")
+        substitutions: dict[str, Callable[[], Any]] = {
+            "current_iteration": lambda: self.iteration_number_current,
+            "next_iteration": lambda: self.iteration_number_next,
+            "now": lambda: now.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "today": lambda: now.date().isoformat(),
+            "tomorrow": lambda: (now.date() + datetime.timedelta(days=1)).isoformat(),
+            "this_week": lambda: now.strftime("%Y/w%U"),
+            "next_week": lambda: (now + datetime.timedelta(days=7)).strftime("%Y/w%U"),
+            "this_month": lambda: now.strftime("%Y-%m"),
+            "next_month": lambda: (now + datetime.timedelta(days=30)).strftime("%Y-%m"),
+        }
+
+        ## Collect the placeholder names that appear in the title:
+        names = {name for _, name, _, _ in string.Formatter().parse(self.title) if name}
 
+        ## Render the title with the referenced substitutions only:
         return self.title.format(
-            current_iteration=self.iteration_number_current,
-            next_iteration=self.iteration_number_next,
-            now=now.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            today=today.isoformat(),
-            tomorrow=tomorrow.isoformat(),
-            this_week=this_week,
-            next_week=next_week,
-            this_month=this_month,
-            next_month=next_month,
+            **{name: fn() for name, fn in substitutions.items() if name in names}
         )
 
     @property
@@ -111,72 +96,78 @@ class Issue(BaseModel):
 
     @property
     def iteration_number(self) -> int:
-        if self.iteration == IterationEnum.current:
+        if self.iteration == "@current":
             return self.iteration_number_current
         else:
             return self.iteration_number_next
 
     @property
     def iteration_number_current(self) -> int:
-        return (datetime.date.today() - self.inception).days // 7
+        return self._iteration_current
 
     @property
     def iteration_number_next(self) -> int:
-        return self.iteration_number_current + 1
+        return self._iteration_current + 1
 
     @classmethod
-    def read(cls, token: str, path: str) -> "Issue":
+    def read(cls, path: str) -> "Issue":
         ## Read the issue file into metadata and content:
-        with open(path, "r") as file:
-            content = frontmatter.load(file)
+        with open(path, "rb") as file:
+            raw = file.read()
 
-        ## Make sure that we have the owner handle:
-        if "owner" not in content.metadata:
-            sys.stderr.write("Error: 'owner' not found in metadata\n")
-            sys.exit(1)
+        ## Locate the front matter delimiters (both must be present):
+        opening = _FRONTMATTER_DELIMITER.match(raw)
+        closing = (
+            _FRONTMATTER_DELIMITER.search(raw, opening.end() + 1) if opening else None
+        )
 
-        ## Attempt to find the owner:
-        owner = Owner.find(token, content.metadata["owner"])  # type: ignore
+        ## Split the front matter from the content and parse it (with libyaml
+        ## bindings when available, which parse much faster than pure Python;
+        ## the import happens here so that runs which never read an issue file
+        ## do not pay for it):
+        if opening and closing:
+            import yaml
+
+            start, stop, rest = opening.end() + 1, closing.start(), closing.end()
+            header = raw[start:stop]
+            body = raw[rest:]
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            metadata = yaml.load(header, Loader=loader) or {}
+        else:
+            metadata, body = {}, raw
 
-        ## Make sure that we have the owner:
-        if owner is None:
-            sys.stderr.write("Error: owner not found\n")
+        ## Make sure that we have the owner handle:
+        if "owner" not in metadata:
+            sys.stderr.write("Error: 'owner' not found in metadata\n")
             sys.exit(1)
 
-        ## Make sure that issue type is excluded if the owner is not an organization:
-        if owner.type != "Organization" and "type" in content.metadata:
-            content.metadata.pop("type")
-
         ## Build args:
-        if "size" in content.metadata and "footprint" not in content.metadata:
-            content.metadata["footprint"] = content.metadata.pop("size")
-        if "difficulty" in content.metadata and "complexity" not in content.metadata:
-            content.metadata["complexity"] = content.metadata.pop("difficulty")
+        if "size" in metadata and "footprint" not in metadata:
+            metadata["footprint"] = metadata.pop("size")
+        if "difficulty" in metadata and "complexity" not in metadata:
+            metadata["complexity"] = metadata.pop("difficulty")
 
         args = {
-            **content.metadata,
-            "owner": owner,
-            "body": content.content,
+            **metadata,
+            "body": body.decode("utf-8").strip(),
         }
 
         ## Attempt to build the issue object and return:
         try:
-            return cls(**args)  # type: ignore
+            return _ISSUE_ADAPTER.validate_python(args)
         except ValidationError as e:
             sys.stderr.write("Error while reading issue file:\n")
             sys.stderr.write(str(e))
             sys.exit(1)
 
 
-class ProjectInfo(BaseModel):
-    id: str
-    status: "ProjectOptionsField"
-    iteration: "ProjectOptionsField"
-    footprint: "ProjectOptionsField"
-    complexity: "ProjectOptionsField"
+#: Validator for Issue, built once at import time so that Issue.read reuses
+#: the compiled pydantic-core schema instead of resolving it per call:
+_ISSUE_ADAPTER = pydantic.TypeAdapter(Issue)
 
 
-class ProjectOptionsField(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ProjectOptionsField:
     """
     This applies to both "SingleSelect" and "Iteration" fields.
 
@@ -188,92 +179,202 @@ class ProjectOptionsField(BaseModel):
     options: dict[str, str]
 
 
-def get_project_info(token: str, owner: Owner, number: int) -> ProjectInfo:
-    ## Define fragments for the GraphQL query:
-    fragments = """
-        fragment SingleSelect on ProjectV2SingleSelectField {
+@dataclass(slots=True, frozen=True)
+class ProjectInfo:
+    id: str
+    owner_type: Literal["User", "Organization"]
+    repository_id: str
+    status: ProjectOptionsField
+    iteration: ProjectOptionsField
+    footprint: ProjectOptionsField
+    complexity: ProjectOptionsField
+
+
+#: Extractor for the (name, id) pair of a field option entry:
+_get_name_id = operator.itemgetter("name", "id")
+
+
+def _build_options(field: dict) -> dict[str, str]:
+    """
+    Builds the option name to option ID mapping of a project field with
+    C-implemented map/itemgetter, avoiding per-item subscript bytecode.
+    """
+
+    return dict(map(_get_name_id, field["options"]))
+
+
+def _project_cache_path(login: str, number: int, repository: str) -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    return os.path.join(
+        cache_home, "gh-cpi", f"project-{login}-{number}-{repository}.json"
+    )
+
+
+def _load_project_cache(path: str) -> dict | None:
+    try:
+        with open(path, "rb") as file:
+            return orjson.loads(file.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _store_project_cache(path: str, etag: str, data: dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp = path + ".tmp"
+    with open(temp, "wb") as file:
+        file.write(orjson.dumps({"etag": etag, "data": data}))
+    os.replace(temp, path)
+
+
+#: Fragments for the project info GraphQL query:
+_PROJECT_INFO_FRAGMENTS = """
+    fragment SingleSelect on ProjectV2SingleSelectField {
+        id
+        options {
             id
-            options {
-                id
-                name
-            }
+            name
         }
+    }
 
-        fragment IterationSelect on ProjectV2IterationField {
-            id
-            configuration {
-                options: iterations {
-                    id
-                    name: title
-                }
+    fragment IterationSelect on ProjectV2IterationField {
+        id
+        configuration {
+            options: iterations {
+                id
+                name: title
             }
         }
+    }
 
-        fragment ProjectFields on ProjectV2 {
-            id
-            status: field(name: "Status") {
-                ... SingleSelect
-            }
-            iteration: field(name: "Iteration") {
-                ... IterationSelect
-            }
-            footprint: field(name: "Footprint") {
-                ... SingleSelect
-            }
-            complexity: field(name: "Complexity") {
-                ... SingleSelect
-            }
+    fragment ProjectFields on ProjectV2 {
+        id
+        status: field(name: "Status") {
+            ... SingleSelect
+        }
+        iteration: field(name: "Iteration") {
+            ... IterationSelect
         }
+        footprint: field(name: "Footprint") {
+            ... SingleSelect
+        }
+        complexity: field(name: "Complexity") {
+            ... SingleSelect
+        }
+    }
+"""
+
+#: Project info query, composed once at import time instead of per call (the
+#: non-matching owner alias resolves to null):
+_PROJECT_INFO_QUERY = f"""
+{_PROJECT_INFO_FRAGMENTS}
+
+query($login: String!, $project: Int!, $repository: String!) {{
+    user(login: $login) {{
+        projectV2(number: $project) {{
+            ... ProjectFields
+        }}
+        repository(name: $repository) {{
+            id
+        }}
+    }}
+    organization(login: $login) {{
+        projectV2(number: $project) {{
+            ... ProjectFields
+        }}
+        repository(name: $repository) {{
+            id
+        }}
+    }}
+}}"""
+
+
+def get_project_info(
+    token: str, owner: str, number: int, repository: str
+) -> ProjectInfo:
     """
+    Queries the project information, serving it from an on-disk cache when the
+    GitHub API reports it unchanged via the cached ETag (`304 Not Modified`).
 
-    ## Define the GraphQL query name as per owner type:
-    query_name = "user" if owner.type == "User" else "organization"
+    The response (field IDs, option IDs, iteration IDs) is essentially static
+    per project, so a warm run skips the response transfer and parse entirely.
 
-    ## Define the query:
-    query = f"""
-    {fragments}
-
-    query($login: String!, $project: Int!) {{
-        owner: {query_name}(login: $login) {{
-            projectV2(number: $project) {{
-                ... ProjectFields
-            }}
-        }}
-    }}"""
+    The owner type is not known up front, so both the `user` and the
+    `organization` fields are queried at once and whichever resolves non-null
+    wins, saving the round-trip that a separate owner lookup would cost.
+    """
 
-    ## Run the GraphQL query:
-    result = gh_gql(token, query, {"login": owner.login, "project": f"{number}"})
+    ## Attempt to load a previously cached response for this project:
+    cache_path = _project_cache_path(owner, number, repository)
+    cached = _load_project_cache(cache_path)
 
-    ## Extract the project data:
-    data = result["data"]["owner"]["projectV2"]
-
-    ## Function to build options:
-    def build_options(field: dict) -> dict[str, str]:
-        return {f["name"]: f["id"] for f in field["options"]}
-
-    ## Build and return the ProjectInfo:
-    return ProjectInfo(
-        **{
-            "id": data["id"],
-            "status": {
-                "id": data["status"]["id"],
-                "options": build_options(data["status"]),
-            },
-            "iteration": {
-                "id": data["iteration"]["id"],
-                "options": build_options(data["iteration"]["configuration"]),
-            },
-            "footprint": {
-                "id": data["footprint"]["id"],
-                "options": build_options(data["footprint"]),
-            },
-            "complexity": {
-                "id": data["complexity"]["id"],
-                "options": build_options(data["complexity"]),
+    ## Build the request headers (conditional on the cached ETag, if any):
+    headers = {"If-None-Match": cached["etag"]} if cached is not None else None
+
+    ## Run the GraphQL query:
+    response = _get_session(token).post(
+        GITHUB_GRAPHQL_URL,
+        json={
+            "query": _PROJECT_INFO_QUERY,
+            "variables": {
+                "login": owner,
+                "project": number,
+                "repository": repository,
             },
-        }
+        },
+        headers=headers,
     )
 
+    ## Serve from the cache if the response has not changed, otherwise parse
+    ## the fresh response and cache it along with its ETag:
+    if response.status_code == 304 and cached is not None:
+        data = cached["data"]
+    else:
+        if response.status_code != 200:
+            raise RuntimeError(f"GitHub Interface Error: {response.text}")
+        result = orjson.loads(response.content)
+        payload = result.get("data") or {}
+        if payload.get("user") is not None:
+            data = {"type": "User", "owner": payload["user"]}
+        elif payload.get("organization") is not None:
+            data = {"type": "Organization", "owner": payload["organization"]}
+        else:
+            raise RuntimeError(f"GitHub Interface Error: {result.get('errors')}")
+        etag = response.headers.get("ETag")
+        if etag:
+            _store_project_cache(cache_path, etag, data)
+
+    ## Extract the project data:
+    project = data["owner"]["projectV2"]
+
+    ## Attempt to build and return the ProjectInfo (dropping the cache if the
+    ## payload no longer matches our expectations):
+    try:
+        return ProjectInfo(
+            id=project["id"],
+            owner_type=data["type"],
+            repository_id=data["owner"]["repository"]["id"],
+            status=ProjectOptionsField(
+                project["status"]["id"],
+                _build_options(project["status"]),
+            ),
+            iteration=ProjectOptionsField(
+                project["iteration"]["id"],
+                _build_options(project["iteration"]["configuration"]),
+            ),
+            footprint=ProjectOptionsField(
+                project["footprint"]["id"],
+                _build_options(project["footprint"]),
+            ),
+            complexity=ProjectOptionsField(
+                project["complexity"]["id"],
+                _build_options(project["complexity"]),
+            ),
+        )
+    except (KeyError, TypeError):
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+        raise
+
 
 ################
 ## OPERATIONS ##
@@ -283,209 +384,315 @@ def get_project_info(token: str, owner: Owner, number: int) -> ProjectInfo:
 def create_project_issue(
     *,
     token: str,
-    repo: str,
-    project_owner: Owner,
+    repository: str,
+    owner: str,
     project_number: int,
     title: str,
     body: str,
     assignees: list[str],
     labels: list[str],
-    ctype: IssueTypeEnum | None,
+    ctype: IssueTypeT | None,
     status: str,
     iteration: str,
     footprint: str,
     complexity: str,
 ) -> str:
-    project = get_project_info(token, project_owner, project_number)
-
-    ## Check if field values are valid:
-    if status not in project.status.options:
-        print(f"Invalid status: {status}")
-        sys.exit(1)
-    elif iteration not in project.iteration.options:
-        print(f"Invalid iteration: {iteration}")
-        sys.exit(1)
-    elif footprint not in project.footprint.options:
-        print(f"Invalid footprint: {footprint}")
-        sys.exit(1)
-    elif complexity not in project.complexity.options:
-        print(f"Invalid complexity: {complexity}")
+    project = get_project_info(token, owner, project_number, repository)
+
+    ## Check if field values are valid, reporting all invalid values at once:
+    checks = (
+        ("status", status, project.status.options),
+        ("iteration", iteration, project.iteration.options),
+        ("footprint", footprint, project.footprint.options),
+        ("complexity", complexity, project.complexity.options),
+    )
+    invalid = [(name, value) for name, value, options in checks if value not in options]
+    if invalid:
+        for name, value in invalid:
+            print(f"Invalid {name}: {value}")
         sys.exit(1)
 
-    issue_url = create_issue(token, repo, title, body, assignees, labels)
-    item_id = add_issue_to_project(token, project_owner, project_number, issue_url)
-
-    set_project_item_field_select(
-        token,
-        project.id,
-        item_id,
-        project.status.id,
-        project.status.options[status],
-    )
-    set_project_item_field_iteration(
-        token,
-        project.id,
-        item_id,
-        project.iteration.id,
-        project.iteration.options[iteration],
-    )
-    set_project_item_field_select(
-        token,
-        project.id,
-        item_id,
-        project.footprint.id,
-        project.footprint.options[footprint],
+    assignee_ids, label_ids = resolve_issue_ids(
+        token, owner, repository, assignees, labels
     )
-    set_project_item_field_select(
-        token,
-        project.id,
-        item_id,
-        project.complexity.id,
-        project.complexity.options[complexity],
+
+    issue_id, issue_url = create_issue(
+        token, project.repository_id, title, body, assignee_ids, label_ids
     )
 
-    ## Set issue type if applicable:
-    if ctype is not None:
-        set_issue_type(token, repo, issue_url.split("/")[-1], ctype)
+    ## The issue-type update is independent of the project item operations, so
+    ## run it concurrently with them instead of serializing the round-trips:
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        ## Set issue type if applicable (issue types are organization-only):
+        issue_type_future = None
+        if ctype is not None and project.owner_type == "Organization":
+            repo = f"{owner}/{repository}"
+            issue_type_future = executor.submit(
+                set_issue_type, token, repo, issue_url.split("/")[-1], ctype
+            )
+
+        item_id = add_issue_to_project(token, project.id, issue_id)
+
+        set_all_project_item_fields(
+            token,
+            project,
+            item_id,
+            {
+                "status": project.status.options[status],
+                "iteration": project.iteration.options[iteration],
+                "footprint": project.footprint.options[footprint],
+                "complexity": project.complexity.options[complexity],
+            },
+        )
+
+        ## Propagate any issue-type update error:
+        if issue_type_future is not None:
+            issue_type_future.result()
 
     return issue_url
 
 
+def resolve_issue_ids(
+    token: str,
+    owner: str,
+    repository: str,
+    assignees: list[str],
+    labels: list[str],
+) -> tuple[list[str], list[str]]:
+    """
+    Resolves assignee logins and label names to their node IDs in a single
+    aliased GraphQL query, as `createIssue` works with IDs instead of values.
+    """
+
+    ## Short-circuit if there is nothing to resolve:
+    if not assignees and not labels:
+        return [], []
+
+    ## Build the variables and the aliased selections:
+    variables: dict[str, Any] = {}
+    declarations = []
+    selections = []
+    label_selections = []
+    for i, login in enumerate(assignees):
+        variables[f"assignee_{i}"] = login
+        declarations.append(f"$assignee_{i}: String!")
+        selections.append(f"assignee_{i}: user(login: $assignee_{i}) {{ id }}")
+    for i, name in enumerate(labels):
+        variables[f"label_{i}"] = name
+        declarations.append(f"$label_{i}: String!")
+        label_selections.append(f"label_{i}: label(name: $label_{i}) {{ id }}")
+    if label_selections:
+        variables["owner"] = owner
+        variables["repository"] = repository
+        declarations.extend(["$owner: String!", "$repository: String!"])
+        inner = " ".join(label_selections)
+        selections.append(f"repository(owner: $owner, name: $repository) {{ {inner} }}")
+
+    ## Define the query:
+    query = "query(" + ", ".join(declarations) + ") {\n" + "\n".join(selections) + "\n}"
+
+    ## Run the GraphQL query:
+    data = gh_gql(token, query, variables)["data"]
+
+    ## Extract and return the resolved IDs:
+    assignee_ids = [data[f"assignee_{i}"]["id"] for i in range(len(assignees))]
+    label_ids = [data["repository"][f"label_{i}"]["id"] for i in range(len(labels))]
+    return assignee_ids, label_ids
+
+
 def create_issue(
     token: str,
-    repo: str,
+    repository_id: str,
     title: str,
     body: str,
-    assignees: list[str],
-    labels: list[str],
-) -> str:
-    output = gh(
-        token,
-        ["issue", "create"],
-        [
-            ("repo", repo),
-            ("title", title),
-            ("body", body),
-            ("assignee", ",".join(assignees)),
-            *[("label", label) for label in labels],
-        ],
-    )
+    assignee_ids: list[str],
+    label_ids: list[str],
+) -> tuple[str, str]:
+    """
+    Creates the issue with a single `createIssue` GraphQL mutation and returns
+    its node ID and URL.
+    """
 
-    return output.strip()
+    query = """mutation(
+        $repository: ID!,
+        $title: String!,
+        $body: String!,
+        $assignees: [ID!],
+        $labels: [ID!]
+    ) {
+        createIssue(input: {
+            repositoryId: $repository,
+            title: $title,
+            body: $body,
+            assigneeIds: $assignees,
+            labelIds: $labels
+        }) {
+            issue {
+                id
+                url
+            }
+        }
+    }"""
+
+    variables: dict[str, Any] = {
+        "repository": repository_id,
+        "title": title,
+        "body": body,
+        "assignees": assignee_ids,
+        "labels": label_ids,
+    }
+
+    issue = gh_gql(token, query, variables)["data"]["createIssue"]["issue"]
+
+    return issue["id"], issue["url"]
 
 
 def set_issue_type(
-    token: str, repo: str, issue_number: int | str, issue_type: IssueTypeEnum
+    token: str, repo: str, issue_number: int | str, issue_type: IssueTypeT
 ) -> None:
-    gh(
-        token,
-        ["api", f"/repos/{repo}/issues/{issue_number}"],
-        [("method", "PATCH"), ("raw-field", f"type={issue_type.value}")],
+    response = _get_session(token).patch(
+        f"{GITHUB_REST_URL}/repos/{repo}/issues/{issue_number}",
+        json={"type": issue_type},
     )
 
+    ## Check for errors:
+    if response.status_code >= 400:
+        raise RuntimeError(f"GitHub Interface Error: {response.text}")
+
 
-def add_issue_to_project(
-    token: str, project_owner: Owner, project_number: int | str, issue_url: str
-) -> str:
-    output = gh(
-        token,
-        ["project", "item-add"],
-        [
-            ("owner", project_owner.login),
-            ("url", issue_url),
-            ("format", "json"),
-        ],
-        [],
-        [f"{project_number}"],
-    )
+def add_issue_to_project(token: str, project_id: str, issue_id: str) -> str:
+    """
+    Adds the issue to the project with an `addProjectV2ItemById` GraphQL
+    mutation and returns the project item ID.
 
-    return json.loads(output)["id"]
+    Note that this can not be batched with `createIssue` as the issue node ID
+    is not known until the `createIssue` response arrives.
+    """
 
+    query = """mutation($project: ID!, $issue: ID!) {
+        addProjectV2ItemById(input: {projectId: $project, contentId: $issue}) {
+            item {
+                id
+            }
+        }
+    }"""
 
-def set_project_item_field_select(
-    token: str, project_id: str, item_id: str, field_id: str, option_id: str
-) -> None:
-    gh(
-        token,
-        ["project", "item-edit"],
-        [
-            ("id", item_id),
-            ("project-id", project_id),
-            ("field-id", field_id),
-            ("single-select-option-id", option_id),
-        ],
-    )
+    result = gh_gql(token, query, {"project": project_id, "issue": issue_id})
+
+    return result["data"]["addProjectV2ItemById"]["item"]["id"]
 
 
-def set_project_item_field_iteration(
-    token: str, project_id: str, item_id: str, field_id: str, iteration_id: str
+def set_all_project_item_fields(
+    token: str, project: ProjectInfo, item_id: str, values: dict[str, str]
 ) -> None:
-    gh(
-        token,
-        ["project", "item-edit"],
-        [
-            ("id", item_id),
-            ("project-id", project_id),
-            ("field-id", field_id),
-            ("iteration-id", iteration_id),
-        ],
+    """
+    Sets all project item field values in a single GraphQL mutation.
+
+    Each field update is an aliased `updateProjectV2ItemFieldValue` mutation in
+    the same document, so that all fields are set with one API call instead of
+    one call per field.
+    """
+
+    ## List the field updates as (alias, field ID, value key, value ID):
+    updates = [
+        ("status", project.status.id, "singleSelectOptionId", values["status"]),
+        ("iteration", project.iteration.id, "iterationId", values["iteration"]),
+        (
+            "footprint",
+            project.footprint.id,
+            "singleSelectOptionId",
+            values["footprint"],
+        ),
+        (
+            "complexity",
+            project.complexity.id,
+            "singleSelectOptionId",
+            values["complexity"],
+        ),
+    ]
+
+    ## Build the variables and the aliased mutations as single expressions:
+    variables = {
+        "project": project.id,
+        "item": item_id,
+        **{f"field_{alias}": field_id for alias, field_id, _, _ in updates},
+        **{f"value_{alias}": value_id for alias, _, _, value_id in updates},
+    }
+    declarations = [
+        "$project: ID!",
+        "$item: ID!",
+        *(f"$field_{alias}: ID!" for alias, _, _, _ in updates),
+        *(f"$value_{alias}: String!" for alias, _, _, _ in updates),
+    ]
+    mutations = [f"""{alias}: updateProjectV2ItemFieldValue(input: {{
+            projectId: $project,
+            itemId: $item,
+            fieldId: $field_{alias},
+            value: {{{value_key}: $value_{alias}}}
+        }}) {{
+            clientMutationId
+        }}""" for alias, _, value_key, _ in updates]
+
+    ## Define the mutation document:
+    query = (
+        "mutation(" + ", ".join(declarations) + ") {\n" + "\n".join(mutations) + "\n}"
     )
 
+    ## Run the GraphQL mutation:
+    gh_gql(token, query, variables)
+
 
 #############
 ## HELPERS ##
 #############
 
 
-def gh(
-    token: str,
-    commands: list[str],
-    options: list[tuple[str, str]],
-    flags: list[str] = [],
-    arguments: list[str] = [],
-) -> Any:
-    ## Build the base command args:
-    args = ["gh", *commands]
+#: GitHub GraphQL API endpoint.
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
 
-    ## Add options to the command args:
-    for key, value in options:
-        args.extend([f"--{key}", value])
+#: GitHub REST API base URL.
+GITHUB_REST_URL = "https://api.github.com"
 
-    ## Add flags to the command args:
-    for flag in flags:
-        args.append(f"--{flag}")
+#: HTTP session shared by all API calls so that a single TCP+TLS connection is
+#: established once and kept alive across requests. It is created lazily (with
+#: a function-local import) so that runs which never hit the API, such as
+#: `--help` and issue-file error paths, do not pay for importing requests.
+_session: requests.Session | None = None
 
-    ## Add additional args to the command:
-    for arg in arguments:
-        args.append(arg)
 
-    ## Build the environment to run the command inside:
-    env = {**os.environ, "GH_TOKEN": token}
+def _get_session(token: str) -> requests.Session:
+    global _session
 
-    ## Run the command:
-    output = subprocess.run(args, env=env, capture_output=True)
+    if _session is None:
+        import requests
 
-    ## Check for errors:
-    if output.returncode != 0:
-        raise RuntimeError(f"GitHub Interface Error: {output.stderr.decode('utf-8')}")
+        _session = requests.Session()
+        _session.headers["Authorization"] = f"bearer {token}"
 
-    ## Return the output:
-    return output.stdout.decode("utf-8")
+    return _session
 
 
-def gh_gql(token: str, query: str, vars: dict[str, str]) -> dict:
+def gh_gql(token: str, query: str, vars: dict[str, Any]) -> dict:
     ## Attempt to issue the query:
-    output = gh(
-        token,
-        ["api", "graphql"],
-        [
-            ("field", f"query={query}"),
-            *[("field", f"{key}={value}") for key, value in vars.items()],
-        ],
+    response = _get_session(token).post(
+        GITHUB_GRAPHQL_URL,
+        json={"query": query, "variables": vars},
     )
 
-    ## Return the parsed JSON output:
-    return json.loads(output)
+    ## Check for transport errors:
+    if response.status_code != 200:
+        raise RuntimeError(f"GitHub Interface Error: {response.text}")
+
+    ## Parse the response body (straight from the received bytes, skipping the
+    ## intermediate str that response.json() would build):
+    result = orjson.loads(response.content)
+
+    ## Check for GraphQL errors:
+    if "errors" in result:
+        raise RuntimeError(f"GitHub Interface Error: {result['errors']}")
+
+    ## Return the parsed response:
+    return result
 
 
 class EnvDefault(argparse.Action):
@@ -530,23 +737,23 @@ def main():
     args = parser.parse_args()
 
     ## Read the issue file:
-    issue = Issue.read(args.token, args.file)
+    issue = Issue.read(args.file)
 
     ## Create the issue:
     issue_url = create_project_issue(
         token=args.token,
-        repo=f"{issue.owner.login}/{issue.repository}",
-        project_owner=issue.owner,
+        repository=issue.repository,
+        owner=issue.owner,
         project_number=issue.project,
         title=issue.title_rendered,
         body=issue.body,
         assignees=issue.assignees,
         labels=issue.labels,
         ctype=issue.type,
-        status=issue.status.value,
+        status=issue.status,
         iteration=issue.iteration_title,
-        footprint=issue.footprint.value,
-        complexity=issue.complexity.value,
+        footprint=issue.footprint,
+        complexity=issue.complexity,
     )
 
     ## Print the issue URL: